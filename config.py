@@ -64,6 +64,17 @@ DATABASE_PATH = os.getenv("DATABASE_PATH", str(BASE_DIR / "database" / "aurea.db
 MODELS_PATH = os.getenv("MODELS_PATH", str(BASE_DIR / "models"))
 LOGS_PATH = os.getenv("LOGS_PATH", str(BASE_DIR / "logs"))
 
+# User cache
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "10000"))
+USER_CACHE_MAX_BYTES = int(os.getenv("USER_CACHE_MAX_MB", "32")) * 1024 * 1024
+
+# Database backups
+BACKUP_PATH = os.getenv("BACKUP_PATH", str(BASE_DIR / "backups"))
+BACKUP_KEEP = int(os.getenv("BACKUP_KEEP", "7"))
+BACKUP_INTERVAL_HOURS = float(os.getenv("BACKUP_INTERVAL_HOURS", "24"))
+BACKUP_PAGES_PER_STEP = int(os.getenv("BACKUP_PAGES_PER_STEP", "256"))
+BACKUP_STEP_SLEEP_MS = float(os.getenv("BACKUP_STEP_SLEEP_MS", "5"))
+
 # ============================================
 # TRADING CONFIGURATION
 # ============================================
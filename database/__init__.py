@@ -2,18 +2,27 @@
 AUREA PRIME ELITE - Database Package
 """
 
-from .db_manager import DatabaseManager
-from .user_db import UserDB
-from .token_db import TokenDB
-from .payment_db import PaymentDB
-from .signal_db import SignalDB
-from .execution_db import ExecutionDB
+from importlib import import_module
 
-__all__ = [
-    'DatabaseManager',
-    'UserDB',
-    'TokenDB',
-    'PaymentDB',
-    'SignalDB',
-    'ExecutionDB'
-]
\ No newline at end of file
+# Public names are imported on first access, so using one module
+# (e.g. python -m database.backup) does not import all of its siblings
+_EXPORTS = {
+    'DatabaseManager': '.db_manager',
+    'UserDB': '.user_db',
+    'UserCache': '.user_cache',
+    'CacheInvalidator': '.user_cache',
+    'TokenDB': '.token_db',
+    'PaymentDB': '.payment_db',
+    'SignalDB': '.signal_db',
+    'ExecutionDB': '.execution_db'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,394 @@
+"""
+AUREA PRIME ELITE - Database Backup
+====================================
+Online backup, verification and restore of the live SQLite database
+
+Usage:
+    python -m database.backup create
+    python -m database.backup list
+    python -m database.backup verify <backup>
+    python -m database.backup restore <backup>
+    python -m database.backup report
+"""
+
+import aiosqlite
+import argparse
+import asyncio
+import gzip
+import hashlib
+import shutil
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, List, Any
+from loguru import logger
+import sys
+
+from .stats import percentile
+from .user_cache import FLUSH_ALL
+
+sys.path.append(str(Path(__file__).parent.parent))
+from config import (
+    DATABASE_PATH, BACKUP_PATH, BACKUP_KEEP,
+    BACKUP_PAGES_PER_STEP, BACKUP_STEP_SLEEP_MS, BACKUP_INTERVAL_HOURS
+)
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _integrity_check(path: Path) -> bool:
+    conn = sqlite3.connect(str(path))
+    try:
+        return conn.execute("PRAGMA integrity_check").fetchone()[0] == 'ok'
+    finally:
+        conn.close()
+
+
+class _BackupRestarted(Exception):
+    """Stepped backup restarted too often because the source kept changing"""
+
+
+class BackupManager:
+    """
+    Online backups of the live database.
+
+    Snapshots are taken with SQLite's backup API a few pages at a time,
+    sleeping between steps so the source lock is released and live queries
+    can run. Each snapshot is gzip-compressed with a .sha256 sidecar.
+
+    A write from another connection restarts a stepped backup from the
+    first page, so under steady writes it may never finish. After
+    max_restarts restarts the snapshot is taken in a single step instead,
+    inside one read transaction. DatabaseManager puts the database in WAL
+    mode, where that read does not block writers. On a database still in
+    rollback journal mode writers wait (up to their busy timeout) for the
+    whole copy, so a warning is logged.
+    """
+
+    def __init__(self, db_path: str = DATABASE_PATH, backup_dir: str = BACKUP_PATH,
+                 keep: int = BACKUP_KEEP, pages_per_step: int = BACKUP_PAGES_PER_STEP,
+                 step_sleep_ms: float = BACKUP_STEP_SLEEP_MS, max_restarts: int = 3):
+        self.db_path = Path(db_path)
+        self.backup_dir = Path(backup_dir)
+        self.keep = keep
+        self.pages_per_step = pages_per_step
+        self.step_sleep = step_sleep_ms / 1000
+        self.max_restarts = max_restarts
+
+    @property
+    def _pattern(self) -> str:
+        return f"{self.db_path.stem}-*.db.gz"
+
+    def list_backups(self) -> List[Path]:
+        """List backups, newest first"""
+        if not self.backup_dir.exists():
+            return []
+        return sorted(self.backup_dir.glob(self._pattern), reverse=True)
+
+    def verify_backup(self, path) -> bool:
+        """Check a backup against its .sha256 sidecar"""
+        path = Path(path)
+        checksum_path = path.with_name(path.name + '.sha256')
+        if not path.exists() or not checksum_path.exists():
+            return False
+        expected = checksum_path.read_text().split()[0]
+        return _sha256(path) == expected
+
+    async def create_backup(self) -> Dict[str, Any]:
+        """Take a compressed, verified snapshot of the live database"""
+        return await asyncio.to_thread(self._create_backup)
+
+    def _create_backup(self) -> Dict[str, Any]:
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        snapshot = self.backup_dir / f"{self.db_path.stem}-{timestamp}.db.part"
+        archive = self.backup_dir / f"{self.db_path.stem}-{timestamp}.db.gz"
+        steps = 0
+        restarts = 0
+        last_remaining = None
+
+        def progress(status, remaining, total):
+            nonlocal steps, restarts, last_remaining
+            steps += 1
+            # Remaining pages only grow when SQLite restarted the copy
+            if last_remaining is not None and remaining > last_remaining:
+                restarts += 1
+                if restarts > self.max_restarts:
+                    raise _BackupRestarted()
+            last_remaining = remaining
+            if remaining:
+                time.sleep(self.step_sleep)
+
+        fallback = False
+        try:
+            source = sqlite3.connect(str(self.db_path))
+            target = sqlite3.connect(str(snapshot))
+            try:
+                try:
+                    source.backup(target, pages=self.pages_per_step, progress=progress)
+                except _BackupRestarted:
+                    logger.warning(
+                        f"Backup restarted {restarts} times under concurrent writes, "
+                        f"copying in a single step"
+                    )
+                    fallback = True
+                    journal_mode = source.execute("PRAGMA journal_mode").fetchone()[0]
+                    if journal_mode != 'wal':
+                        logger.warning(
+                            f"Database is in {journal_mode} journal mode, writers wait for the whole copy"
+                        )
+                    source.backup(target)
+            finally:
+                target.close()
+                source.close()
+
+            if not _integrity_check(snapshot):
+                raise RuntimeError(f"Snapshot failed integrity check: {snapshot}")
+
+            with open(snapshot, 'rb') as src, gzip.open(archive, 'wb', compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+
+            checksum = _sha256(archive)
+            archive.with_name(archive.name + '.sha256').write_text(f"{checksum}  {archive.name}\n")
+            if not self.verify_backup(archive):
+                raise RuntimeError(f"Backup checksum mismatch: {archive}")
+
+            result = {
+                'path': str(archive),
+                'sha256': checksum,
+                'size': snapshot.stat().st_size,
+                'compressed_size': archive.stat().st_size,
+                'steps': steps,
+                'restarts': restarts,
+                'fallback': fallback,
+                'duration': time.perf_counter() - started
+            }
+        except Exception:
+            archive.unlink(missing_ok=True)
+            archive.with_name(archive.name + '.sha256').unlink(missing_ok=True)
+            raise
+        finally:
+            snapshot.unlink(missing_ok=True)
+
+        result['removed'] = self._rotate()
+        logger.info(
+            f"Database backup created: {archive.name} "
+            f"({result['compressed_size'] / 1024:.0f} KB, {result['duration']:.1f}s)"
+        )
+        return result
+
+    def _rotate(self) -> List[str]:
+        """Delete backups beyond the retention count"""
+        removed = []
+        for path in self.list_backups()[self.keep:]:
+            path.unlink(missing_ok=True)
+            path.with_name(path.name + '.sha256').unlink(missing_ok=True)
+            removed.append(path.name)
+        return removed
+
+    async def restore_backup(self, path, target: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Restore a backup into the target database (default: live database).
+        The snapshot is verified before the target is touched.
+        """
+        return await asyncio.to_thread(self._restore_backup, Path(path), Path(target or self.db_path))
+
+    def _restore_backup(self, path: Path, target: Path) -> Dict[str, Any]:
+        started = time.perf_counter()
+        if not self.verify_backup(path):
+            raise ValueError(f"Backup failed checksum verification: {path}")
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        snapshot = target.with_name(target.name + '.restore')
+        try:
+            with gzip.open(path, 'rb') as src, open(snapshot, 'wb') as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            if not _integrity_check(snapshot):
+                raise ValueError(f"Backup failed integrity check: {path}")
+
+            # Copy through the backup API so open connections see a consistent database
+            source = sqlite3.connect(str(snapshot))
+            destination = sqlite3.connect(str(target), timeout=30)
+            try:
+                last_id = self._invalidation_seq(destination)
+                source.backup(destination)
+                self._flush_user_caches(destination, last_id)
+            finally:
+                destination.close()
+                source.close()
+        finally:
+            snapshot.unlink(missing_ok=True)
+
+        logger.info(f"Database restored from {path.name}")
+        return {'path': str(path), 'target': str(target), 'duration': time.perf_counter() - started}
+
+    @staticmethod
+    def _invalidation_seq(conn: sqlite3.Connection) -> int:
+        """Last cache invalidation id handed out in the database"""
+        try:
+            row = conn.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'cache_invalidations'"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return 0
+        return row[0] if row else 0
+
+    def _flush_user_caches(self, conn: sqlite3.Connection, last_id: int):
+        """
+        Tell running services to drop their user caches after a restore.
+        The restored invalidation log is replaced by a single flush entry
+        numbered after every id the services have already seen.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'cache_invalidations'"
+        ).fetchone()
+        if not exists:
+            # Running invalidators clear their caches and stop caching on
+            # their own until a restart migrates the restored schema again
+            logger.warning("Restored database predates the cache invalidation log, restart services to migrate it")
+            return
+        last_id = max(last_id, self._invalidation_seq(conn))
+        with conn:
+            conn.execute("DELETE FROM cache_invalidations")
+            conn.execute("DELETE FROM sqlite_sequence WHERE name = 'cache_invalidations'")
+            conn.execute(
+                "INSERT INTO sqlite_sequence (name, seq) VALUES ('cache_invalidations', ?)", (last_id,)
+            )
+            conn.execute(
+                "INSERT INTO cache_invalidations (user_id, source, created_at) VALUES (?, ?, ?)",
+                (FLUSH_ALL, 'restore', datetime.utcnow().isoformat())
+            )
+
+    async def measure_impact(self, baseline_seconds: float = 5.0, interval: float = 0.01,
+                             probe_query: str = "SELECT * FROM users ORDER BY user_id DESC LIMIT 1",
+                             probe_write: str = "UPDATE users SET tier = tier "
+                                                "WHERE user_id = (SELECT MIN(user_id) FROM users)"
+                             ) -> Dict[str, Any]:
+        """
+        Measure how much a running backup adds to query latency.
+        Probes the database from the event loop with a read and a write
+        that rewrites a row unchanged, first without and then during a
+        backup, and compares the latency percentiles.
+        """
+        db = await aiosqlite.connect(str(self.db_path))
+
+        async def probe(phase: Dict[str, Any]):
+            started = time.perf_counter()
+            cursor = await db.execute(probe_query)
+            await cursor.fetchall()
+            phase['read'].append((time.perf_counter() - started) * 1000)
+
+            started = time.perf_counter()
+            try:
+                await db.execute(probe_write)
+                await db.commit()
+            except sqlite3.OperationalError as e:
+                await db.rollback()
+                if 'locked' not in str(e):
+                    raise
+                phase['locked'] += 1
+            phase['write'].append((time.perf_counter() - started) * 1000)
+            await asyncio.sleep(interval)
+
+        try:
+            baseline = {'read': [], 'write': [], 'locked': 0}
+            deadline = time.perf_counter() + baseline_seconds
+            while time.perf_counter() < deadline:
+                await probe(baseline)
+
+            during = {'read': [], 'write': [], 'locked': 0}
+            backup_task = asyncio.create_task(self.create_backup())
+            while not backup_task.done():
+                await probe(during)
+            backup = await backup_task
+        finally:
+            await db.close()
+
+        def summary(samples: List[float]) -> Dict[str, float]:
+            return {
+                'queries': len(samples),
+                'p50_ms': percentile(samples, 50),
+                'p95_ms': percentile(samples, 95),
+                'p99_ms': percentile(samples, 99),
+                'max_ms': max(samples) if samples else 0.0
+            }
+
+        result = {'backup': backup}
+        for kind in ('read', 'write'):
+            base = summary(baseline[kind])
+            loaded = summary(during[kind])
+            result[kind] = {
+                'baseline': base,
+                'during_backup': loaded,
+                'p99_added_ms': loaded['p99_ms'] - base['p99_ms']
+            }
+        result['write']['baseline']['locked'] = baseline['locked']
+        result['write']['during_backup']['locked'] = during['locked']
+        return result
+
+
+async def backup_loop(manager: Optional[BackupManager] = None,
+                      interval_hours: float = BACKUP_INTERVAL_HOURS):
+    """Create a backup every interval, for use as a background task in a service"""
+    manager = manager or BackupManager()
+    while True:
+        try:
+            await manager.create_backup()
+        except Exception as e:
+            logger.error(f"Database backup failed: {e}")
+        await asyncio.sleep(interval_hours * 3600)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AUREA PRIME ELITE database backup")
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('create', help="Create a backup of the live database")
+    sub.add_parser('list', help="List existing backups")
+    verify = sub.add_parser('verify', help="Verify a backup checksum")
+    verify.add_argument('path')
+    restore = sub.add_parser('restore', help="Restore a backup into the live database")
+    restore.add_argument('path')
+    restore.add_argument('--target', default=None, help="Restore into this file instead")
+    report = sub.add_parser('report', help="Measure backup impact on query latency")
+    report.add_argument('--baseline', type=float, default=5.0, help="Baseline seconds")
+    args = parser.parse_args()
+
+    manager = BackupManager()
+    if args.command == 'create':
+        result = asyncio.run(manager.create_backup())
+        print(f"{result['path']}  sha256={result['sha256']}")
+    elif args.command == 'list':
+        for path in manager.list_backups():
+            status = "OK" if manager.verify_backup(path) else "CORRUPT"
+            print(f"{path.name}  {path.stat().st_size / 1024:.0f} KB  {status}")
+    elif args.command == 'verify':
+        ok = manager.verify_backup(args.path)
+        print("OK" if ok else "CORRUPT")
+        sys.exit(0 if ok else 1)
+    elif args.command == 'restore':
+        result = asyncio.run(manager.restore_backup(args.path, args.target))
+        print(f"Restored {result['path']} -> {result['target']} in {result['duration']:.2f}s")
+    elif args.command == 'report':
+        result = asyncio.run(manager.measure_impact(baseline_seconds=args.baseline))
+        for kind in ('read', 'write'):
+            for phase in ('baseline', 'during_backup'):
+                s = result[kind][phase]
+                locked = f" locked={s['locked']}" if 'locked' in s else ""
+                print(f"{kind:<5} {phase:<14} n={s['queries']:<6} p50={s['p50_ms']:.2f}ms "
+                      f"p95={s['p95_ms']:.2f}ms p99={s['p99_ms']:.2f}ms max={s['max_ms']:.2f}ms{locked}")
+        backup = result['backup']
+        print(f"Backup adds {result['read']['p99_added_ms']:.2f}ms to read p99 and "
+              f"{result['write']['p99_added_ms']:.2f}ms to write p99 "
+              f"({backup['duration']:.1f}s, {backup['steps']} steps, fallback={backup['fallback']})")
+
+
+if __name__ == "__main__":
+    main()
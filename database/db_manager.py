@@ -12,6 +12,7 @@ import sys
 
 sys.path.append(str(Path(__file__).parent.parent))
 from config import DATABASE_PATH
+from .migrations import MigrationRunner
 
 
 class DatabaseManager:
@@ -19,6 +20,8 @@ class DatabaseManager:
     
     _instance = None
     _db = None
+    _migration_task = None
+    db_path = DATABASE_PATH
     
     def __new__(cls):
         if cls._instance is None:
@@ -28,25 +31,22 @@ class DatabaseManager:
     async def connect(self):
         """Initialize database connection"""
         if self._db is None:
-            db_path = Path(DATABASE_PATH)
+            db_path = Path(self.db_path)
             db_path.parent.mkdir(parents=True, exist_ok=True)
             
-            self._db = await aiosqlite.connect(DATABASE_PATH)
+            self._db = await aiosqlite.connect(self.db_path)
             self._db.row_factory = aiosqlite.Row
+            # Readers (including backups) no longer block writers, and the
+            # setting is stored in the file for every other process
+            await self._db.execute("PRAGMA journal_mode=WAL")
             await self._init_tables()
-            logger.info(f"Database connected: {DATABASE_PATH}")
+            logger.info(f"Database connected: {self.db_path}")
         return self._db
     
     async def _init_tables(self):
-        """Initialize database tables from schema"""
-        schema_path = Path(__file__).parent / "schema.sql"
-        
-        if schema_path.exists():
-            with open(schema_path, 'r') as f:
-                schema = f.read()
-            await self._db.executescript(schema)
-            await self._db.commit()
-            logger.info("Database tables initialized")
+        """Bring the schema up to date, deferring heavy migrations to the background"""
+        runner = MigrationRunner(self.db_path)
+        self._migration_task = await runner.run(self._db)
     
     async def execute(self, query: str, params: tuple = None):
         """Execute a query"""
@@ -69,6 +69,13 @@ class DatabaseManager:
     
     async def close(self):
         """Close database connection"""
+        if self._migration_task and not self._migration_task.done():
+            self._migration_task.cancel()
+            try:
+                await self._migration_task
+            except asyncio.CancelledError:
+                pass
+        self._migration_task = None
         if self._db:
             await self._db.close()
             self._db = None
@@ -0,0 +1,374 @@
+"""
+AUREA PRIME ELITE - Database Load Test
+=======================================
+Simulate concurrent Telegram users and EA terminals against DatabaseManager
+
+Runs entirely against a temporary database. Each worker process owns one
+DatabaseManager connection, like the bot, WebSocket server and news monitor
+do in production, so cross-process lock contention shows up as it would live.
+The shared DatabaseManager instance is never touched, so the harness can run
+inside a live service without reaching the production database.
+
+Usage:
+    python -m database.loadtest --duration 60 --processes 3 --menu-rate 500
+    python -m database.loadtest --ramp --heartbeat-rate 2000
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Any
+
+from .db_manager import DatabaseManager
+from .stats import percentile
+
+OPERATIONS = ('menu_read', 'quota_increment', 'payment', 'heartbeat')
+
+
+class LoadTestDatabase(DatabaseManager):
+    """DatabaseManager bound to its own database file instead of the shared instance"""
+
+    def __new__(cls, db_path: str):
+        return object.__new__(cls)
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+
+
+def _terminal(index: int) -> tuple:
+    """Token and MT5 ID of a simulated EA terminal"""
+    return f"T{index:07d}", str(100000 + index)
+
+
+async def seed_database(db_path: str, users: int, terminals: int):
+    """Create the schema and populate simulated users and EA tokens"""
+    manager = LoadTestDatabase(db_path)
+    db = await manager.connect()
+    if manager._migration_task:
+        await manager._migration_task
+
+    now = datetime.utcnow()
+    await db.executemany(
+        "INSERT INTO users (user_id, username, first_name, tier, last_signal_reset) VALUES (?, ?, ?, ?, ?)",
+        [(user_id, f"user{user_id}", f"User {user_id}", random.choice(['FREE', 'PREMIUM', 'SUPER']), now.isoformat())
+         for user_id in range(1, users + 1)]
+    )
+    await db.executemany(
+        "INSERT INTO tokens (token, mt5_id, user_id, tier, expired_at) VALUES (?, ?, ?, ?, ?)",
+        [(*_terminal(i), (i % users) + 1, 'SUPER', (now + timedelta(days=30)).isoformat())
+         for i in range(terminals)]
+    )
+    await db.commit()
+    await manager.close()
+
+
+class LoadWorker:
+    """
+    Open-loop load generator for a single process.
+    Operations arrive as Poisson processes and are not throttled by
+    response time, so a saturated database shows up as growing latency.
+    """
+
+    def __init__(self, db_path: str, rates: Dict[str, float], duration: float, interval: float,
+                 users: int, terminals: int, start_at: float, ramp: bool = False,
+                 max_inflight: int = 5000, lag_probe: float = 0.05, seed: int = None):
+        self.db_path = db_path
+        self.rates = rates
+        self.duration = duration
+        self.interval = interval
+        self.users = users
+        self.terminals = terminals
+        self.start_at = start_at
+        self.ramp = ramp
+        self.max_inflight = max_inflight
+        self.lag_probe = lag_probe
+        self.random = random.Random(seed)
+        self.db = LoadTestDatabase(db_path)
+        self.inflight = 0
+        self.buckets = [self._new_bucket() for _ in range(int(duration // interval) + 1)]
+
+    @staticmethod
+    def _new_bucket() -> Dict[str, Any]:
+        return {
+            'latency': {op: [] for op in OPERATIONS},
+            'locked': {op: 0 for op in OPERATIONS},
+            'errors': {op: 0 for op in OPERATIONS},
+            'dropped': 0,
+            'lag': []
+        }
+
+    def _bucket(self) -> Dict[str, Any]:
+        index = int((time.time() - self.start_at) // self.interval)
+        return self.buckets[max(0, min(index, len(self.buckets) - 1))]
+
+    def _rate_factor(self) -> float:
+        if not self.ramp:
+            return 1.0
+        return max(0.05, min(1.0, (time.time() - self.start_at) / self.duration))
+
+    # Simulated operations. The document-style UserDB/TokenDB/PaymentDB
+    # modules are not bound to SQLite, so these issue the equivalent SQL.
+
+    async def menu_read(self):
+        """Bot handler loading a user to render a menu (UserDB.get_user)"""
+        user_id = self.random.randint(1, self.users)
+        await self.db.fetchone("SELECT * FROM users WHERE user_id = ?", (user_id,))
+
+    async def quota_increment(self):
+        """Signal delivered to a FREE user (UserDB.increment_daily_signals)"""
+        user_id = self.random.randint(1, self.users)
+        await self.db.execute(
+            "UPDATE users SET daily_signals_used = daily_signals_used + 1, last_active = ? WHERE user_id = ?",
+            (datetime.utcnow().isoformat(), user_id)
+        )
+
+    async def payment(self):
+        """Payment proof submitted from the bot (PaymentDB.create_payment)"""
+        user_id = self.random.randint(1, self.users)
+        await self.db.execute(
+            "INSERT INTO payments (user_id, username, first_name, package, duration, tier, amount, proof_url) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (user_id, f"user{user_id}", f"User {user_id}", 'XAU', '1M', 'PREMIUM', 49000,
+             f"https://t.me/proof/{user_id}")
+        )
+
+    async def heartbeat(self):
+        """EA terminal token check (TokenDB.validate_token)"""
+        token, mt5_id = _terminal(self.random.randrange(self.terminals))
+        row = await self.db.fetchone("SELECT * FROM tokens WHERE token = ?", (token,))
+        if row is None or not row['is_active'] or row['mt5_id'] != mt5_id:
+            raise ValueError(f"Token rejected: {token}")
+        if datetime.utcnow() > datetime.fromisoformat(row['expired_at']):
+            raise ValueError(f"Token expired: {token}")
+
+    async def _timed(self, op: str):
+        # Attribute results to the arrival interval so a backlog shows up
+        # as rising latency rather than piling into the final interval
+        bucket = self._bucket()
+        started = time.perf_counter()
+        try:
+            await getattr(self, op)()
+            bucket['latency'][op].append((time.perf_counter() - started) * 1000)
+        except sqlite3.OperationalError as e:
+            if 'locked' in str(e):
+                bucket['locked'][op] += 1
+            else:
+                bucket['errors'][op] += 1
+        except Exception:
+            bucket['errors'][op] += 1
+        finally:
+            self.inflight -= 1
+
+    async def _generate(self, op: str, rate: float, deadline: float):
+        tasks = set()
+        while True:
+            delay = self.random.expovariate(rate * self._rate_factor())
+            if time.time() + delay >= deadline:
+                break
+            await asyncio.sleep(delay)
+            if self.inflight >= self.max_inflight:
+                self._bucket()['dropped'] += 1
+                continue
+            self.inflight += 1
+            task = asyncio.create_task(self._timed(op))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    async def _monitor_lag(self, deadline: float):
+        while time.time() < deadline:
+            expected = time.perf_counter() + self.lag_probe
+            await asyncio.sleep(self.lag_probe)
+            self._bucket()['lag'].append(max(0.0, (time.perf_counter() - expected) * 1000))
+
+    async def run(self) -> List[Dict[str, Any]]:
+        await self.db.connect()
+        await asyncio.sleep(max(0.0, self.start_at - time.time()))
+        deadline = self.start_at + self.duration
+        try:
+            await asyncio.gather(
+                self._monitor_lag(deadline),
+                *(self._generate(op, rate, deadline) for op, rate in self.rates.items() if rate > 0)
+            )
+        finally:
+            await self.db.close()
+        return self.buckets
+
+
+def _run_worker(kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return asyncio.run(LoadWorker(**kwargs).run())
+
+
+def _summarize(buckets: List[Dict[str, Any]], seconds: float) -> Dict[str, Any]:
+    latencies = [ms for bucket in buckets for op in OPERATIONS for ms in bucket['latency'][op]]
+    lag = [ms for bucket in buckets for ms in bucket['lag']]
+    return {
+        'completed': len(latencies),
+        'throughput': len(latencies) / seconds if seconds else 0.0,
+        'p50_ms': percentile(latencies, 50),
+        'p95_ms': percentile(latencies, 95),
+        'p99_ms': percentile(latencies, 99),
+        'locked': sum(sum(bucket['locked'].values()) for bucket in buckets),
+        'errors': sum(sum(bucket['errors'].values()) for bucket in buckets),
+        'dropped': sum(bucket['dropped'] for bucket in buckets),
+        'loop_lag_p99_ms': percentile(lag, 99),
+        'loop_lag_max_ms': max(lag) if lag else 0.0
+    }
+
+
+def aggregate(results: List[List[Dict[str, Any]]], interval: float, duration: float) -> Dict[str, Any]:
+    """Merge per-process buckets into a timeline, per-operation and overall summary"""
+    merged = [LoadWorker._new_bucket() for _ in range(len(results[0]))]
+    for buckets in results:
+        for target, bucket in zip(merged, buckets):
+            for op in OPERATIONS:
+                target['latency'][op].extend(bucket['latency'][op])
+                target['locked'][op] += bucket['locked'][op]
+                target['errors'][op] += bucket['errors'][op]
+            target['dropped'] += bucket['dropped']
+            target['lag'].extend(bucket['lag'])
+
+    timeline = []
+    for index, bucket in enumerate(merged):
+        start = index * interval
+        span = min(interval, duration - start)
+        if span <= 0:
+            break
+        timeline.append({'t': start, **_summarize([bucket], span)})
+
+    operations = {}
+    for op in OPERATIONS:
+        latencies = [ms for bucket in merged for ms in bucket['latency'][op]]
+        operations[op] = {
+            'completed': len(latencies),
+            'throughput': len(latencies) / duration,
+            'p50_ms': percentile(latencies, 50),
+            'p95_ms': percentile(latencies, 95),
+            'p99_ms': percentile(latencies, 99),
+            'locked': sum(bucket['locked'][op] for bucket in merged),
+            'errors': sum(bucket['errors'][op] for bucket in merged)
+        }
+
+    return {'timeline': timeline, 'operations': operations, 'total': _summarize(merged, duration)}
+
+
+def run_load_test(duration: float = 60.0, interval: float = 5.0, processes: int = 3,
+                  users: int = 5000, terminals: int = 1000, rates: Dict[str, float] = None,
+                  ramp: bool = False, max_inflight: int = 5000, seed: int = 0) -> Dict[str, Any]:
+    """
+    Run a load test against a fresh temporary database.
+
+    Args:
+        duration: Test length in seconds
+        interval: Width of each timeline bucket in seconds
+        processes: Number of worker processes, each with its own connection
+        users: Number of simulated Telegram users
+        terminals: Number of simulated EA terminals
+        rates: Total arrivals per second for each operation
+        ramp: Increase arrival rates linearly up to the target over the run
+        max_inflight: Per-process cap on concurrent operations
+        seed: Random seed
+    """
+    rates = rates or {'menu_read': 200, 'quota_increment': 50, 'payment': 2, 'heartbeat': 100}
+    with tempfile.TemporaryDirectory(prefix='aurea-loadtest-') as tmp:
+        db_path = str(Path(tmp) / 'loadtest.db')
+        random.seed(seed)
+        asyncio.run(seed_database(db_path, users, terminals))
+
+        start_at = time.time() + 2.0 + processes * 0.5
+        jobs = [{
+            'db_path': db_path,
+            'rates': {op: rate / processes for op, rate in rates.items()},
+            'duration': duration,
+            'interval': interval,
+            'users': users,
+            'terminals': terminals,
+            'start_at': start_at,
+            'ramp': ramp,
+            'max_inflight': max_inflight,
+            'seed': seed + i
+        } for i in range(processes)]
+
+        context = multiprocessing.get_context('spawn')
+        with context.Pool(processes) as pool:
+            results = pool.map(_run_worker, jobs)
+
+    report = aggregate(results, interval, duration)
+    report['config'] = {
+        'duration': duration, 'processes': processes, 'users': users,
+        'terminals': terminals, 'rates': rates, 'ramp': ramp
+    }
+    return report
+
+
+def print_report(report: Dict[str, Any]):
+    header = f"{'t(s)':>6} {'ops/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'locked':>7} {'errors':>7} {'dropped':>8} {'lag99':>7} {'lagmax':>7}"
+    print(header)
+    print('-' * len(header))
+    for row in report['timeline']:
+        print(f"{row['t']:>6.0f} {row['throughput']:>8.0f} {row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} "
+              f"{row['p99_ms']:>8.2f} {row['locked']:>7} {row['errors']:>7} {row['dropped']:>8} "
+              f"{row['loop_lag_p99_ms']:>7.1f} {row['loop_lag_max_ms']:>7.1f}")
+
+    print()
+    print(f"{'operation':<16} {'done':>8} {'ops/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'locked':>7} {'errors':>7}")
+    for op, row in report['operations'].items():
+        print(f"{op:<16} {row['completed']:>8} {row['throughput']:>8.0f} {row['p50_ms']:>8.2f} "
+              f"{row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f} {row['locked']:>7} {row['errors']:>7}")
+
+    total = report['total']
+    print()
+    print(f"Total: {total['completed']} ops, {total['throughput']:.0f} ops/s, p99 {total['p99_ms']:.2f}ms, "
+          f"{total['locked']} locked, {total['errors']} errors, {total['dropped']} dropped, "
+          f"max loop lag {total['loop_lag_max_ms']:.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AUREA PRIME ELITE database load test")
+    parser.add_argument('--duration', type=float, default=60.0, help="Test length in seconds")
+    parser.add_argument('--interval', type=float, default=5.0, help="Report interval in seconds")
+    parser.add_argument('--processes', type=int, default=3, help="Worker processes (services)")
+    parser.add_argument('--users', type=int, default=5000, help="Simulated Telegram users")
+    parser.add_argument('--terminals', type=int, default=1000, help="Simulated EA terminals")
+    parser.add_argument('--menu-rate', type=float, default=200, help="Menu reads per second")
+    parser.add_argument('--quota-rate', type=float, default=50, help="Quota increments per second")
+    parser.add_argument('--payment-rate', type=float, default=2, help="Payment submissions per second")
+    parser.add_argument('--heartbeat-rate', type=float, default=100, help="EA heartbeats per second")
+    parser.add_argument('--ramp', action='store_true', help="Ramp arrival rates up to target")
+    parser.add_argument('--max-inflight', type=int, default=5000, help="Per-process concurrency cap")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed")
+    parser.add_argument('--json', default=None, help="Write the full report to this file")
+    args = parser.parse_args()
+
+    report = run_load_test(
+        duration=args.duration,
+        interval=args.interval,
+        processes=args.processes,
+        users=args.users,
+        terminals=args.terminals,
+        rates={
+            'menu_read': args.menu_rate,
+            'quota_increment': args.quota_rate,
+            'payment': args.payment_rate,
+            'heartbeat': args.heartbeat_rate
+        },
+        ramp=args.ramp,
+        max_inflight=args.max_inflight,
+        seed=args.seed
+    )
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+AUREA PRIME ELITE - Schema Migrations
+======================================
+Versioned schema migrations tracked in PRAGMA user_version
+
+Applied migrations are frozen: never edit a migration or its SQL file in
+sql/ once released. Schema changes go into a new migration appended to
+MIGRATIONS, and schema.sql is updated to match as the reference schema.
+"""
+
+import aiosqlite
+import asyncio
+from pathlib import Path
+from loguru import logger
+
+
+class Backfill:
+    """
+    Chunked UPDATE for backfilling a column on a large table.
+    Each chunk runs in its own short transaction so other writers
+    only ever wait for a single chunk.
+
+    The where clause must stop matching a row once it has been updated
+    (e.g. "new_col IS NULL" when setting new_col), otherwise the same
+    rows are selected again and the backfill never finishes.
+    """
+
+    def __init__(self, table: str, assignments: str, where: str, chunk_size: int = 500):
+        self.table = table
+        self.assignments = assignments
+        self.where = where
+        self.chunk_size = chunk_size
+
+    async def run(self, db, pause: float = 0.0) -> int:
+        """Apply the backfill chunk by chunk, returning the number of rows updated"""
+        query = (
+            f"UPDATE {self.table} SET {self.assignments} WHERE rowid IN ("
+            f"SELECT rowid FROM {self.table} WHERE {self.where} LIMIT ?)"
+        )
+        total = 0
+        while True:
+            cursor = await db.execute(query, (self.chunk_size,))
+            await db.commit()
+            if cursor.rowcount <= 0:
+                return total
+            total += cursor.rowcount
+            await asyncio.sleep(pause)
+
+
+class Migration:
+    """
+    A single schema version.
+
+    Foreground migrations run before the connection is handed out.
+    Background migrations run on their own connection after startup,
+    one statement (or backfill chunk) per transaction. Every step must be
+    idempotent, since an interrupted migration is replayed on next start.
+
+    Running in the background only keeps startup from waiting. A single
+    statement such as CREATE INDEX is still one write transaction, so on
+    a large table other writers can wait past their busy timeout and fail
+    with "database is locked" while it runs. Only Backfill steps are
+    split into short transactions.
+    """
+
+    def __init__(self, version: int, description: str, script: str = None,
+                 steps: list = None, background: bool = False):
+        self.version = version
+        self.description = description
+        self.script = script
+        self.steps = steps or []
+        self.background = background
+
+
+MIGRATIONS = [
+    Migration(1, "Initial schema", script="sql/v001_initial.sql"),
+    Migration(2, "Cross-process user cache invalidation log", steps=[
+        "CREATE TABLE IF NOT EXISTS cache_invalidations ("
+        "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+        "user_id TEXT, "
+        "source TEXT, "
+        "created_at DATETIME)",
+    ]),
+    Migration(3, "Indexes for token, payment queue and signal history lookups", steps=[
+        "CREATE INDEX IF NOT EXISTS idx_tokens_user_active ON tokens(user_id, is_active)",
+        "CREATE INDEX IF NOT EXISTS idx_payments_status_created ON payments(status, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_signals_created_at ON signals(created_at)",
+    ], background=True),
+]
+
+
+class MigrationRunner:
+    """Apply pending migrations, skipping all work when the schema is current"""
+
+    def __init__(self, db_path: str, migrations: list = None, pause: float = 0.05):
+        self.db_path = db_path
+        self.migrations = sorted(migrations or MIGRATIONS, key=lambda m: m.version)
+        self.pause = pause
+
+    @property
+    def latest_version(self) -> int:
+        return self.migrations[-1].version if self.migrations else 0
+
+    async def get_version(self, db) -> int:
+        """Read the schema version stored in the database"""
+        cursor = await db.execute("PRAGMA user_version")
+        row = await cursor.fetchone()
+        return row[0]
+
+    async def run(self, db):
+        """
+        Apply pending foreground migrations on the given connection.
+        Returns the task running the remaining migrations in the background,
+        or None when nothing is left to do.
+        """
+        version = await self.get_version(db)
+        pending = [m for m in self.migrations if m.version > version]
+        if not pending:
+            logger.debug(f"Database schema is current (v{version})")
+            return None
+
+        while pending and not pending[0].background:
+            await self._apply(db, pending.pop(0))
+
+        if pending:
+            return asyncio.create_task(self._run_background(pending))
+        return None
+
+    async def _run_background(self, pending: list):
+        """Apply migrations on a dedicated connection without blocking startup"""
+        db = await aiosqlite.connect(self.db_path)
+        try:
+            for migration in pending:
+                await self._apply(db, migration)
+        except asyncio.CancelledError:
+            logger.warning("Background migration cancelled, it will resume on next start")
+            raise
+        except Exception as e:
+            logger.error(f"Background migration failed: {e}")
+        finally:
+            await db.close()
+
+    async def _apply(self, db, migration: Migration):
+        """Apply a single migration and record its version"""
+        # Another service may have applied it while we were waiting
+        if await self.get_version(db) >= migration.version:
+            return
+
+        logger.info(f"Applying migration v{migration.version}: {migration.description}")
+
+        if migration.script:
+            script_path = Path(__file__).parent / migration.script
+            with open(script_path, 'r') as f:
+                await db.executescript(f.read())
+            await db.commit()
+
+        for step in migration.steps:
+            if isinstance(step, Backfill):
+                await step.run(db, self.pause if migration.background else 0.0)
+            else:
+                await db.execute(step)
+                await db.commit()
+            if migration.background:
+                await asyncio.sleep(self.pause)
+
+        await db.execute(f"PRAGMA user_version = {int(migration.version)}")
+        await db.commit()
+        logger.info(f"Database schema at v{migration.version}")
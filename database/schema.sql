@@ -2,6 +2,9 @@
 -- AUREA PRIME ELITE - Database Schema
 -- SQLite Database
 -- ============================================
+-- Reference schema only, it is not applied to databases.
+-- Any change here must also be added as a new migration
+-- in migrations.py, or existing databases will not get it.
 
 -- Table: users
 CREATE TABLE IF NOT EXISTS users (
@@ -145,6 +148,14 @@ CREATE TABLE IF NOT EXISTS system_logs (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Table: cache_invalidations (cross-process user cache invalidation)
+CREATE TABLE IF NOT EXISTS cache_invalidations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT,
+    source TEXT,
+    created_at DATETIME
+);
+
 -- Indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_users_tier ON users(tier);
 CREATE INDEX IF NOT EXISTS idx_users_token ON users(token);
@@ -153,4 +164,7 @@ CREATE INDEX IF NOT EXISTS idx_payments_user_id ON payments(user_id);
 CREATE INDEX IF NOT EXISTS idx_payments_status ON payments(status);
 CREATE INDEX IF NOT EXISTS idx_signals_user_id ON signals(user_id);
 CREATE INDEX IF NOT EXISTS idx_executions_user_id ON executions(user_id);
-CREATE INDEX IF NOT EXISTS idx_news_events_time ON news_events(event_time);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_news_events_time ON news_events(event_time);
+CREATE INDEX IF NOT EXISTS idx_tokens_user_active ON tokens(user_id, is_active);
+CREATE INDEX IF NOT EXISTS idx_payments_status_created ON payments(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_signals_created_at ON signals(created_at);
\ No newline at end of file
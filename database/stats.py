@@ -0,0 +1,17 @@
+"""
+AUREA PRIME ELITE - Latency Statistics
+=======================================
+Helpers shared by the backup impact report and the load test
+"""
+
+import math
+from typing import List
+
+
+def percentile(samples: List[float], percent: float) -> float:
+    """Nearest-rank percentile of a list of samples, 0.0 when empty"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, math.ceil(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
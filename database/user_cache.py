@@ -0,0 +1,330 @@
+"""
+User Cache Module for AUREA PRIME ELITE
+Bounded LRU cache for user records with cross-process invalidation
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+import uuid
+from collections import OrderedDict
+from copy import deepcopy
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable
+
+
+# Invalidation published for a user_id of FLUSH_ALL drops every cached user
+FLUSH_ALL = '*'
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate the memory footprint of a user record in bytes."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += _estimate_size(key) + _estimate_size(item)
+    elif isinstance(value, (list, tuple, set)):
+        for item in value:
+            size += _estimate_size(item)
+    return size
+
+
+class UserCache:
+    """
+    Thread-safe LRU cache of user records.
+    Bounded both by number of entries and by approximate memory usage.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 32 * 1024 * 1024):
+        """
+        Initialize UserCache.
+
+        Args:
+            max_entries: Maximum number of cached users
+            max_bytes: Maximum approximate memory used by cached records
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached user record.
+
+        Args:
+            user_id: The unique identifier of the user
+
+        Returns:
+            Copy of the cached record or None on miss
+        """
+        user_id = str(user_id)
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return deepcopy(entry[0])
+
+    def put(self, user_id: str, user: Dict[str, Any]) -> None:
+        """
+        Store a user record, evicting least recently used entries if needed.
+
+        Args:
+            user_id: The unique identifier of the user
+            user: User record to cache
+        """
+        user_id = str(user_id)
+        record = deepcopy(user)
+        with self._lock:
+            self._put_locked(user_id, record)
+
+    def update(self, user_id: str, fields: Dict[str, Any]) -> None:
+        """
+        Update a cached record in place. No-op if the user is not cached.
+
+        Args:
+            user_id: The unique identifier of the user
+            fields: Fields to overwrite on the cached record
+        """
+        user_id = str(user_id)
+        fields = deepcopy(fields)
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return
+            record = dict(entry[0])
+            record.update(fields)
+            self._put_locked(user_id, record)
+
+    def _put_locked(self, user_id: str, record: Dict[str, Any]) -> None:
+        """Store a record and evict as needed. Caller must hold the lock."""
+        size = _estimate_size(record)
+        self._discard(user_id)
+        if size > self.max_bytes:
+            return
+        self._entries[user_id] = (record, size)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a single user from the cache."""
+        user_id = str(user_id)
+        with self._lock:
+            if self._discard(user_id):
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every cached user."""
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+
+    def _discard(self, user_id: str) -> bool:
+        entry = self._entries.pop(user_id, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[1]
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache metrics.
+
+        Returns:
+            Dict with hits, misses, hit ratio, evictions and memory usage
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations
+            }
+
+
+class CacheInvalidator:
+    """
+    Cross-process invalidation for UserCache.
+
+    Writers append changed user IDs to a small table in a shared SQLite file.
+    Readers poll PRAGMA data_version, which only changes when another
+    connection commits, so an idle poll costs a single pragma call.
+
+    The cache_invalidations table is created by schema migration v2. Until
+    the database file and that table exist the invalidator is unavailable:
+    poll() keeps the local cache empty and callers should bypass it.
+    """
+
+    def __init__(self, cache: UserCache, db_path: str, retention: int = 10000):
+        """
+        Initialize CacheInvalidator. If the database is not migrated yet,
+        it is opened later by the first poll or publish that finds it ready.
+
+        Args:
+            cache: The local cache to invalidate
+            db_path: Path of the SQLite file shared by all processes
+            retention: Number of invalidation rows to keep
+        """
+        self.cache = cache
+        self.db_path = db_path
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._source = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._conn = None
+        self._last_id = 0
+        self._data_version = None
+        with self._lock:
+            self._connect()
+
+    @property
+    def available(self) -> bool:
+        """Whether invalidations can currently be exchanged with other processes"""
+        return self._conn is not None
+
+    def _connect(self) -> bool:
+        """Open the shared database if it is migrated. Caller must hold the lock."""
+        if self._conn is not None:
+            return True
+        # mode=rw: never create the database file as a side effect
+        uri = Path(self.db_path).resolve().as_uri() + '?mode=rw'
+        try:
+            conn = sqlite3.connect(uri, uri=True, timeout=5, check_same_thread=False, isolation_level=None)
+        except sqlite3.OperationalError:
+            return False
+        try:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'cache_invalidations'"
+            ).fetchone()
+            if not exists:
+                conn.close()
+                return False
+            self._last_id = conn.execute(
+                "SELECT COALESCE(MAX(id), 0) FROM cache_invalidations"
+            ).fetchone()[0]
+            self._data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.OperationalError:
+            conn.close()
+            return False
+        self._conn = conn
+        # Changes made before we connected were never seen
+        self.cache.clear()
+        return True
+
+    def _lost_table(self, error: sqlite3.OperationalError) -> bool:
+        """
+        Handle the invalidation log disappearing, e.g. after restoring a
+        backup taken before migration v2. Caller must hold the lock.
+        Returns False if the error is unrelated.
+        """
+        if 'no such table' not in str(error):
+            return False
+        self._conn.close()
+        self._conn = None
+        self.cache.clear()
+        return True
+
+    def _read_data_version(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def publish(self, user_ids: Iterable[str]) -> None:
+        """
+        Notify other processes that the given users changed.
+
+        Args:
+            user_ids: IDs of the users whose records changed
+        """
+        now = datetime.utcnow().isoformat()
+        rows = [(str(user_id), self._source, now) for user_id in user_ids]
+        if not rows:
+            return
+        with self._lock:
+            # Nobody can be caching while the invalidation log is unavailable
+            if not self._connect():
+                return
+            try:
+                self._conn.executemany(
+                    "INSERT INTO cache_invalidations (user_id, source, created_at) VALUES (?, ?, ?)", rows
+                )
+                last_id = self._conn.execute("SELECT MAX(id) FROM cache_invalidations").fetchone()[0]
+                if last_id > self.retention:
+                    self._conn.execute(
+                        "DELETE FROM cache_invalidations WHERE id <= ?", (last_id - self.retention,)
+                    )
+            except sqlite3.OperationalError as e:
+                if not self._lost_table(e):
+                    raise
+
+    def poll(self) -> int:
+        """
+        Apply invalidations published by other processes.
+        Clears the cache while the invalidation log is unavailable.
+
+        Returns:
+            Number of invalidation records applied
+        """
+        with self._lock:
+            if not self._connect():
+                self.cache.clear()
+                return 0
+
+            data_version = self._read_data_version()
+            if data_version == self._data_version:
+                return 0
+            self._data_version = data_version
+
+            try:
+                oldest, newest = self._conn.execute(
+                    "SELECT MIN(id), MAX(id) FROM cache_invalidations"
+                ).fetchone()
+                rows = self._conn.execute(
+                    "SELECT id, user_id, source FROM cache_invalidations WHERE id > ? ORDER BY id",
+                    (self._last_id,)
+                ).fetchall()
+            except sqlite3.OperationalError as e:
+                if not self._lost_table(e):
+                    raise
+                return 0
+            missed = oldest is not None and oldest > self._last_id + 1
+            # Ids went backwards, e.g. the database was restored from a backup
+            reset = (newest or 0) < self._last_id
+
+            if reset:
+                self._last_id = newest or 0
+            elif rows:
+                self._last_id = rows[-1][0]
+
+        # Pruned rows, a restore or an explicit flush: we can no longer tell what changed
+        if missed or reset or any(user_id == FLUSH_ALL for _, user_id, _ in rows):
+            self.cache.clear()
+        else:
+            for _, user_id, source in rows:
+                if source != self._source:
+                    self.cache.invalidate(user_id)
+        return len(rows)
+
+    def close(self) -> None:
+        """Close the invalidation connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -3,9 +3,16 @@ User Database Module for AUREA PRIME ELITE
 Handles all user-related database operations
 """
 
+import sys
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Optional, Dict, List, Any
 
+from .user_cache import UserCache, CacheInvalidator
+
+sys.path.append(str(Path(__file__).parent.parent))
+from config import DATABASE_PATH, USER_CACHE_MAX_ENTRIES, USER_CACHE_MAX_BYTES
+
 
 class UserDB:
     """
@@ -13,15 +20,56 @@ class UserDB:
     Provides methods for user creation, retrieval, and management.
     """
 
-    def __init__(self, db_connection):
+    def __init__(self, db_connection, cache: Optional[UserCache] = None,
+                 invalidator: Optional[CacheInvalidator] = None):
         """
         Initialize UserDB with a database connection.
         
+        By default the cache is kept coherent with the other services
+        through a CacheInvalidator on DATABASE_PATH. The cache is bypassed
+        until that database has been migrated. Passing only a cache
+        disables cross-process invalidation, which is safe only when a
+        single process writes users.
+        
         Args:
             db_connection: Database connection object
+            cache: User record cache (default: new cache sized from config)
+            invalidator: Cross-process invalidator shared with other workers
         """
         self.db = db_connection
         self.collection = self.db.get_collection('users')
+        if cache is None and invalidator is None:
+            cache = UserCache(USER_CACHE_MAX_ENTRIES, USER_CACHE_MAX_BYTES)
+            invalidator = CacheInvalidator(cache, DATABASE_PATH)
+        self.cache = cache or invalidator.cache
+        self.invalidator = invalidator
+
+    def _apply_update(self, user_id: str, fields: Dict[str, Any], modified: bool) -> None:
+        """
+        Write-through a successful update to the cache and notify other workers.
+        
+        Args:
+            user_id: The unique identifier of the user
+            fields: Fields written to the user record
+            modified: Whether the database update matched the user
+        """
+        if not modified:
+            self._invalidate(user_id)
+            return
+        self.cache.update(user_id, fields)
+        if self.invalidator:
+            self.invalidator.publish([user_id])
+
+    def _invalidate(self, user_id: str) -> None:
+        """
+        Drop a user from this and every other worker's cache.
+        
+        Args:
+            user_id: The unique identifier of the user
+        """
+        self.cache.invalidate(user_id)
+        if self.invalidator:
+            self.invalidator.publish([user_id])
 
     def create_user(self, user_id: str, username: str, tier: str = 'free', **kwargs) -> Dict[str, Any]:
         """
@@ -50,11 +98,15 @@ class UserDB:
             'updated_at': datetime.utcnow().isoformat()
         }
         self.collection.insert_one(user_data)
+        self.cache.put(user_id, user_data)
+        if self.invalidator:
+            self.invalidator.publish([user_id])
         return user_data
 
     def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a user by their ID.
+        Served from the cache when possible, loaded and cached on a miss.
         
         Args:
             user_id: The unique identifier of the user
@@ -62,7 +114,20 @@ class UserDB:
         Returns:
             Dict containing user data or None if not found
         """
-        return self.collection.find_one({'user_id': user_id})
+        if self.invalidator:
+            self.invalidator.poll()
+            # Other workers' writes can't reach us yet (database not migrated)
+            if not self.invalidator.available:
+                return self.collection.find_one({'user_id': user_id})
+
+        user = self.cache.get(user_id)
+        if user is not None:
+            return user
+
+        user = self.collection.find_one({'user_id': user_id})
+        if user is not None:
+            self.cache.put(user_id, user)
+        return user
 
     def update_tier(self, user_id: str, new_tier: str, duration_days: int = 30) -> bool:
         """
@@ -77,17 +142,14 @@ class UserDB:
             bool indicating success or failure
         """
         subscription_end = datetime.utcnow() + timedelta(days=duration_days)
-        result = self.collection.update_one(
-            {'user_id': user_id},
-            {
-                '$set': {
-                    'tier': new_tier,
-                    'subscription_start': datetime.utcnow().isoformat(),
-                    'subscription_end': subscription_end.isoformat(),
-                    'updated_at': datetime.utcnow().isoformat()
-                }
-            }
-        )
+        fields = {
+            'tier': new_tier,
+            'subscription_start': datetime.utcnow().isoformat(),
+            'subscription_end': subscription_end.isoformat(),
+            'updated_at': datetime.utcnow().isoformat()
+        }
+        result = self.collection.update_one({'user_id': user_id}, {'$set': fields})
+        self._apply_update(user_id, fields, result.modified_count > 0)
         return result.modified_count > 0
 
     def update_mt5_id(self, user_id: str, mt5_id: str) -> bool:
@@ -101,15 +163,12 @@ class UserDB:
         Returns:
             bool indicating success or failure
         """
-        result = self.collection.update_one(
-            {'user_id': user_id},
-            {
-                '$set': {
-                    'mt5_id': mt5_id,
-                    'updated_at': datetime.utcnow().isoformat()
-                }
-            }
-        )
+        fields = {
+            'mt5_id': mt5_id,
+            'updated_at': datetime.utcnow().isoformat()
+        }
+        result = self.collection.update_one({'user_id': user_id}, {'$set': fields})
+        self._apply_update(user_id, fields, result.modified_count > 0)
         return result.modified_count > 0
 
     def update_settings(self, user_id: str, settings: Dict[str, Any]) -> bool:
@@ -123,15 +182,12 @@ class UserDB:
         Returns:
             bool indicating success or failure
         """
-        result = self.collection.update_one(
-            {'user_id': user_id},
-            {
-                '$set': {
-                    'settings': settings,
-                    'updated_at': datetime.utcnow().isoformat()
-                }
-            }
-        )
+        fields = {
+            'settings': settings,
+            'updated_at': datetime.utcnow().isoformat()
+        }
+        result = self.collection.update_one({'user_id': user_id}, {'$set': fields})
+        self._apply_update(user_id, fields, result.modified_count > 0)
         return result.modified_count > 0
 
     def increment_daily_signals(self, user_id: str) -> Dict[str, Any]:
@@ -153,25 +209,25 @@ class UserDB:
         
         # Reset count if it's a new day
         if user.get('daily_signals_reset') != today:
-            self.collection.update_one(
-                {'user_id': user_id},
-                {
-                    '$set': {
-                        'daily_signals_count': 1,
-                        'daily_signals_reset': today,
-                        'updated_at': datetime.utcnow().isoformat()
-                    }
-                }
-            )
+            fields = {
+                'daily_signals_count': 1,
+                'daily_signals_reset': today,
+                'updated_at': datetime.utcnow().isoformat()
+            }
+            result = self.collection.update_one({'user_id': user_id}, {'$set': fields})
+            self._apply_update(user_id, fields, result.modified_count > 0)
             return {'success': True, 'count': 1}
         else:
-            result = self.collection.update_one(
+            self.collection.update_one(
                 {'user_id': user_id},
                 {
                     '$inc': {'daily_signals_count': 1},
                     '$set': {'updated_at': datetime.utcnow().isoformat()}
                 }
             )
+            # The stored count may include increments from other workers,
+            # so drop the entry rather than caching a client-side count
+            self._invalidate(user_id)
             new_count = user.get('daily_signals_count', 0) + 1
             return {'success': True, 'count': new_count}
 
@@ -199,16 +255,13 @@ class UserDB:
         Returns:
             bool indicating success or failure
         """
-        result = self.collection.update_one(
-            {'user_id': user_id},
-            {
-                '$set': {
-                    'tier': 'free',
-                    'subscription_end': None,
-                    'updated_at': datetime.utcnow().isoformat()
-                }
-            }
-        )
+        fields = {
+            'tier': 'free',
+            'subscription_end': None,
+            'updated_at': datetime.utcnow().isoformat()
+        }
+        result = self.collection.update_one({'user_id': user_id}, {'$set': fields})
+        self._apply_update(user_id, fields, result.modified_count > 0)
         return result.modified_count > 0
 
     def get_all_users_by_tier(self, tier: str) -> List[Dict[str, Any]]:
@@ -259,3 +312,12 @@ class UserDB:
             'member_since': user.get('created_at'),
             'last_updated': user.get('updated_at')
         }
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get user cache metrics.
+        
+        Returns:
+            Dict with hit ratio, evictions and memory usage of the cache
+        """
+        return self.cache.stats()
@@ -0,0 +1,28 @@
+"""
+Shared test fixtures
+"""
+
+import asyncio
+
+import aiosqlite
+import pytest
+
+from database.migrations import MigrationRunner
+
+
+@pytest.fixture
+def migrated_db(tmp_path):
+    """Path of a fresh database with every migration applied"""
+    path = str(tmp_path / "migrated.db")
+
+    async def migrate():
+        db = await aiosqlite.connect(path)
+        try:
+            task = await MigrationRunner(path, pause=0).run(db)
+            if task:
+                await task
+        finally:
+            await db.close()
+
+    asyncio.run(migrate())
+    return path
@@ -0,0 +1,170 @@
+"""
+Tests for online database backup and restore
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from database.backup import BackupManager
+from database.user_cache import UserCache, CacheInvalidator
+
+
+@pytest.fixture
+def live_db(tmp_path):
+    path = tmp_path / "live.db"
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE signals (id INTEGER PRIMARY KEY AUTOINCREMENT, payload TEXT)")
+    conn.executemany("INSERT INTO signals (payload) VALUES (?)", [('x' * 500,) for _ in range(20000)])
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _count(path) -> int:
+    conn = sqlite3.connect(str(path))
+    try:
+        return conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_backup_finishes_under_concurrent_writes(live_db, tmp_path):
+    manager = BackupManager(
+        db_path=str(live_db), backup_dir=str(tmp_path / "backups"), keep=2,
+        pages_per_step=8, step_sleep_ms=5, max_restarts=3
+    )
+    stop = threading.Event()
+
+    def writer():
+        conn = sqlite3.connect(str(live_db), timeout=30)
+        while not stop.is_set():
+            conn.execute("INSERT INTO signals (payload) VALUES ('live')")
+            conn.commit()
+            time.sleep(0.02)
+        conn.close()
+
+    writer_thread = threading.Thread(target=writer, daemon=True)
+    writer_thread.start()
+
+    result = {}
+    backup_thread = threading.Thread(target=lambda: result.update(manager._create_backup()), daemon=True)
+    try:
+        time.sleep(0.1)
+        backup_thread.start()
+        backup_thread.join(timeout=30)
+        assert not backup_thread.is_alive(), "backup did not finish under concurrent writes"
+    finally:
+        stop.set()
+        writer_thread.join()
+
+    assert result['fallback'] is True
+    assert manager.verify_backup(result['path'])
+
+    restored = tmp_path / "restored.db"
+    asyncio.run(manager.restore_backup(result['path'], str(restored)))
+    assert _count(restored) >= 20000
+
+
+def test_backup_rotation_and_corruption(live_db, tmp_path):
+    manager = BackupManager(db_path=str(live_db), backup_dir=str(tmp_path / "backups"), keep=1)
+    first = manager._create_backup()
+    assert first['fallback'] is False
+    assert manager.verify_backup(first['path'])
+
+    time.sleep(1.1)
+    second = manager._create_backup()
+    assert manager.list_backups() == [Path(second['path'])]
+
+    with open(second['path'], 'ab') as f:
+        f.write(b'corrupt')
+    assert not manager.verify_backup(second['path'])
+    with pytest.raises(ValueError):
+        manager._restore_backup(manager.list_backups()[0], tmp_path / "restored.db")
+
+
+def test_restore_flushes_user_caches(migrated_db, tmp_path):
+    db_path = migrated_db
+    manager = BackupManager(db_path=db_path, backup_dir=str(tmp_path / "backups"))
+    cache_a, cache_b = UserCache(), UserCache()
+    invalidator_a = CacheInvalidator(cache_a, db_path)
+    invalidator_b = CacheInvalidator(cache_b, db_path)
+    try:
+        invalidator_a.publish(['1'])
+        backup = manager._create_backup()
+        invalidator_a.publish(['2', '3', '4'])
+        invalidator_b.poll()
+
+        cache_b.put('5', {'tier': 'PREMIUM'})
+        manager._restore_backup(Path(backup['path']), Path(db_path))
+        invalidator_b.poll()
+        assert cache_b.get('5') is None
+
+        cache_b.put('7', {'tier': 'FREE'})
+        invalidator_a.publish(['7'])
+        assert invalidator_b.poll() == 1
+        assert cache_b.get('7') is None
+    finally:
+        invalidator_a.close()
+        invalidator_b.close()
+
+
+def test_restore_of_unmigrated_backup_disables_caching(migrated_db, tmp_path):
+    old_db = tmp_path / "old.db"
+    sqlite3.connect(str(old_db)).execute("CREATE TABLE users (user_id TEXT)").connection.close()
+    backup = BackupManager(db_path=str(old_db), backup_dir=str(tmp_path / "backups"))._create_backup()
+
+    db_path = migrated_db
+    cache = UserCache()
+    invalidator = CacheInvalidator(cache, db_path)
+    try:
+        cache.put('5', {'tier': 'PREMIUM'})
+        BackupManager(db_path=db_path, backup_dir=str(tmp_path / "backups"))._restore_backup(
+            Path(backup['path']), Path(db_path)
+        )
+        assert invalidator.poll() == 0
+        assert not invalidator.available
+        assert cache.get('5') is None
+        invalidator.publish(['5'])
+    finally:
+        invalidator.close()
+
+
+def test_database_manager_enables_wal(tmp_path, monkeypatch):
+    from database.db_manager import DatabaseManager
+    path = tmp_path / "wal.db"
+    monkeypatch.setattr(DatabaseManager, 'db_path', str(path))
+
+    async def connect():
+        manager = DatabaseManager()
+        await manager.connect()
+        await manager.close()
+
+    asyncio.run(connect())
+    conn = sqlite3.connect(str(path))
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+    finally:
+        conn.close()
+
+
+def test_measure_impact_reports_reads_and_writes(migrated_db, tmp_path):
+    conn = sqlite3.connect(migrated_db)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("INSERT INTO users (user_id, tier) VALUES (1, 'FREE')")
+    conn.commit()
+    conn.close()
+    manager = BackupManager(db_path=migrated_db, backup_dir=str(tmp_path / "backups"))
+
+    report = asyncio.run(manager.measure_impact(baseline_seconds=0.2, interval=0.001))
+
+    for kind in ('read', 'write'):
+        assert report[kind]['baseline']['queries'] > 0
+        assert report[kind]['during_backup']['queries'] > 0
+    assert report['write']['baseline']['locked'] == 0
+    assert report['write']['during_backup']['locked'] == 0
+    assert manager.verify_backup(report['backup']['path'])
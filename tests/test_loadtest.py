@@ -0,0 +1,103 @@
+"""
+Tests for the database load test harness
+"""
+
+import asyncio
+import sqlite3
+import time
+
+from database.db_manager import DatabaseManager
+from database.loadtest import (
+    OPERATIONS, LoadTestDatabase, LoadWorker, aggregate, run_load_test, seed_database
+)
+
+
+def _worker(**kwargs) -> LoadWorker:
+    options = {
+        'db_path': 'unused.db', 'rates': {}, 'duration': 2.0, 'interval': 1.0,
+        'users': 10, 'terminals': 5, 'start_at': time.time()
+    }
+    options.update(kwargs)
+    return LoadWorker(**options)
+
+
+def test_seed_does_not_touch_shared_manager(tmp_path):
+    shared = DatabaseManager()
+    db_path = str(tmp_path / "loadtest.db")
+
+    asyncio.run(seed_database(db_path, users=10, terminals=5))
+
+    assert DatabaseManager() is shared
+    assert shared.db_path == DatabaseManager.db_path != db_path
+    assert shared._db is None
+    assert LoadTestDatabase(db_path) is not LoadTestDatabase(db_path)
+
+
+def test_timed_counts_lock_errors_separately():
+    worker = _worker()
+
+    async def locked():
+        raise sqlite3.OperationalError("database is locked")
+
+    async def broken():
+        raise sqlite3.OperationalError("no such table: users")
+
+    async def rejected():
+        raise ValueError("Token rejected")
+
+    async def ok():
+        pass
+
+    worker.menu_read = locked
+    worker.quota_increment = broken
+    worker.heartbeat = rejected
+    worker.payment = ok
+    worker.inflight = 4
+
+    async def run():
+        for op in ('menu_read', 'quota_increment', 'heartbeat', 'payment'):
+            await worker._timed(op)
+
+    asyncio.run(run())
+    bucket = worker.buckets[0]
+    assert bucket['locked'] == {'menu_read': 1, 'quota_increment': 0, 'payment': 0, 'heartbeat': 0}
+    assert bucket['errors'] == {'menu_read': 0, 'quota_increment': 1, 'payment': 0, 'heartbeat': 1}
+    assert len(bucket['latency']['payment']) == 1
+    assert worker.inflight == 0
+
+
+def test_aggregate_merges_processes_per_interval():
+    def buckets(latency, locked):
+        result = [LoadWorker._new_bucket() for _ in range(3)]
+        for index, bucket in enumerate(result):
+            bucket['latency']['menu_read'] = [latency] * (index + 1)
+            bucket['locked']['payment'] = locked
+            bucket['lag'] = [1.0]
+        return result
+
+    report = aggregate([buckets(1.0, 1), buckets(3.0, 2)], interval=1.0, duration=2.5)
+
+    assert [row['t'] for row in report['timeline']] == [0.0, 1.0, 2.0]
+    assert [row['completed'] for row in report['timeline']] == [2, 4, 6]
+    # The last bucket only covers half an interval
+    assert report['timeline'][2]['throughput'] == 12.0
+    assert report['timeline'][0]['locked'] == 3
+    assert report['operations']['menu_read']['completed'] == 12
+    assert report['operations']['menu_read']['p99_ms'] == 3.0
+    assert report['operations']['payment']['locked'] == 9
+    assert report['total']['throughput'] == 12 / 2.5
+
+
+def test_load_test_smoke():
+    report = run_load_test(
+        duration=2.0, interval=1.0, processes=1, users=20, terminals=5,
+        rates={'menu_read': 20, 'quota_increment': 5, 'payment': 1, 'heartbeat': 10}
+    )
+
+    assert set(report['operations']) == set(OPERATIONS)
+    assert len(report['timeline']) == 2
+    total = report['total']
+    assert total['completed'] > 0
+    assert total['errors'] == 0
+    assert total['locked'] == 0
+    assert total['p99_ms'] > 0
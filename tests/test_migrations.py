@@ -0,0 +1,79 @@
+"""
+Tests for versioned schema migrations
+"""
+
+import asyncio
+
+import aiosqlite
+
+from database.migrations import Backfill, Migration, MigrationRunner
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_runner_applies_pending_and_skips_when_current(tmp_path):
+    db_path = str(tmp_path / "test.db")
+    runner = MigrationRunner(db_path, pause=0)
+
+    async def scenario():
+        db = await aiosqlite.connect(db_path)
+        try:
+            task = await runner.run(db)
+            if task:
+                await task
+            assert await runner.get_version(db) == runner.latest_version
+
+            cursor = await db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+            tables = {row[0] for row in await cursor.fetchall()}
+            assert {'users', 'tokens', 'payments', 'signals'} <= tables
+
+            assert await runner.run(db) is None
+        finally:
+            await db.close()
+
+    _run(scenario())
+
+
+def test_background_migration_runs_after_foreground(tmp_path):
+    db_path = str(tmp_path / "test.db")
+    migrations = [
+        Migration(1, "table", steps=["CREATE TABLE t (a INTEGER)"]),
+        Migration(2, "index", steps=["CREATE INDEX IF NOT EXISTS idx_t_a ON t(a)"], background=True),
+    ]
+    runner = MigrationRunner(db_path, migrations=migrations, pause=0)
+
+    async def scenario():
+        db = await aiosqlite.connect(db_path)
+        try:
+            task = await runner.run(db)
+            assert task is not None
+            assert await runner.get_version(db) == 1
+            await task
+            assert await runner.get_version(db) == 2
+        finally:
+            await db.close()
+
+    _run(scenario())
+
+
+def test_backfill_updates_in_chunks(tmp_path):
+    db_path = str(tmp_path / "test.db")
+
+    async def scenario():
+        db = await aiosqlite.connect(db_path)
+        try:
+            await db.execute("CREATE TABLE t (a INTEGER, b INTEGER)")
+            await db.executemany("INSERT INTO t (a) VALUES (?)", [(i,) for i in range(1234)])
+            await db.commit()
+
+            updated = await Backfill('t', 'b = a * 2', 'b IS NULL', chunk_size=100).run(db)
+            assert updated == 1234
+
+            cursor = await db.execute("SELECT COUNT(*) FROM t WHERE b = a * 2")
+            assert (await cursor.fetchone())[0] == 1234
+        finally:
+            await db.close()
+
+    _run(scenario())
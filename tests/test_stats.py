@@ -0,0 +1,13 @@
+"""
+Tests for latency statistics helpers
+"""
+
+from database.stats import percentile
+
+
+def test_percentile_is_nearest_rank():
+    samples = list(range(1, 1061))
+    assert percentile(samples, 99) == 1050
+    assert percentile(samples, 50) == 530
+    assert percentile([5.0], 99) == 5.0
+    assert percentile([], 99) == 0.0
@@ -0,0 +1,126 @@
+"""
+Tests for the user cache and cross-process invalidation
+"""
+
+import sqlite3
+
+import pytest
+
+from database.user_cache import UserCache, CacheInvalidator
+
+
+def test_lru_evicts_least_recently_used():
+    cache = UserCache(max_entries=2)
+    cache.put('1', {'tier': 'FREE'})
+    cache.put('2', {'tier': 'FREE'})
+    assert cache.get('1') is not None
+
+    cache.put('3', {'tier': 'FREE'})
+
+    assert cache.get('2') is None
+    assert cache.get('1') is not None
+    assert cache.get('3') is not None
+    assert cache.stats()['evictions'] == 1
+
+
+def test_max_bytes_caps_memory():
+    record = {'username': 'x' * 1000}
+    cache = UserCache(max_entries=100, max_bytes=3000)
+    for user_id in range(10):
+        cache.put(user_id, record)
+
+    stats = cache.stats()
+    assert stats['bytes'] <= 3000
+    assert 0 < stats['entries'] < 10
+    assert cache.get(9) is not None
+
+    cache.put('huge', {'username': 'x' * 10000})
+    assert cache.get('huge') is None
+
+
+def test_update_writes_through_and_returns_copies():
+    cache = UserCache()
+    cache.put(1, {'tier': 'FREE', 'daily_signals_count': 0})
+    cache.update('1', {'tier': 'PREMIUM'})
+    cache.update('missing', {'tier': 'PREMIUM'})
+
+    user = cache.get(1)
+    assert user == {'tier': 'PREMIUM', 'daily_signals_count': 0}
+    user['tier'] = 'SUPREME'
+    assert cache.get(1)['tier'] == 'PREMIUM'
+    assert cache.get('missing') is None
+
+    stats = cache.stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+    assert stats['hit_ratio'] == pytest.approx(2 / 3)
+
+
+def test_invalidation_across_processes(migrated_db):
+    cache_a, cache_b = UserCache(), UserCache()
+    invalidator_a = CacheInvalidator(cache_a, migrated_db)
+    invalidator_b = CacheInvalidator(cache_b, migrated_db)
+    try:
+        cache_a.put('7', {'tier': 'FREE'})
+        cache_b.put('7', {'tier': 'FREE'})
+        cache_b.put('8', {'tier': 'FREE'})
+
+        invalidator_a.publish(['7'])
+
+        # Own invalidations are not applied back to the publisher's cache
+        assert invalidator_a.poll() == 0
+        assert cache_a.get('7') is not None
+        assert invalidator_b.poll() == 1
+        assert cache_b.get('7') is None
+        assert cache_b.get('8') is not None
+
+        # Nothing new: data_version is unchanged and poll is a no-op
+        assert invalidator_b.poll() == 0
+    finally:
+        invalidator_a.close()
+        invalidator_b.close()
+
+
+def test_pruned_invalidations_clear_the_cache(migrated_db):
+    cache_a, cache_b = UserCache(), UserCache()
+    invalidator_a = CacheInvalidator(cache_a, migrated_db, retention=2)
+    invalidator_b = CacheInvalidator(cache_b, migrated_db)
+    try:
+        cache_b.put('1', {'tier': 'FREE'})
+        cache_b.put('99', {'tier': 'FREE'})
+
+        invalidator_a.publish(['2', '3', '4', '5', '6'])
+        invalidator_b.poll()
+
+        assert cache_b.stats()['entries'] == 0
+    finally:
+        invalidator_a.close()
+        invalidator_b.close()
+
+
+def test_poll_recovers_when_ids_go_backwards(migrated_db):
+    cache_a, cache_b = UserCache(), UserCache()
+    invalidator_a = CacheInvalidator(cache_a, migrated_db)
+    invalidator_b = CacheInvalidator(cache_b, migrated_db)
+    try:
+        invalidator_a.publish(['1', '2', '3'])
+        invalidator_b.poll()
+        cache_b.put('7', {'tier': 'FREE'})
+
+        # Simulate an older copy of the database replacing the live one
+        conn = sqlite3.connect(migrated_db)
+        with conn:
+            conn.execute("DELETE FROM cache_invalidations WHERE id > 1")
+            conn.execute("UPDATE sqlite_sequence SET seq = 1 WHERE name = 'cache_invalidations'")
+        conn.close()
+
+        invalidator_b.poll()
+        assert cache_b.get('7') is None
+
+        cache_b.put('7', {'tier': 'FREE'})
+        invalidator_a.publish(['7'])
+        assert invalidator_b.poll() == 1
+        assert cache_b.get('7') is None
+    finally:
+        invalidator_a.close()
+        invalidator_b.close()
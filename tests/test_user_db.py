@@ -0,0 +1,143 @@
+"""
+Tests for UserDB caching backed by a fake document collection
+"""
+
+from copy import deepcopy
+
+import pytest
+
+from database.user_cache import UserCache, CacheInvalidator
+from database.user_db import UserDB
+
+
+class FakeResult:
+    def __init__(self, modified_count: int):
+        self.modified_count = modified_count
+
+
+class FakeCollection:
+    """Minimal in-memory stand-in for the users collection"""
+
+    def __init__(self):
+        self.documents = {}
+        self.reads = 0
+
+    def insert_one(self, document):
+        self.documents[document['user_id']] = deepcopy(document)
+
+    def find_one(self, query):
+        self.reads += 1
+        document = self.documents.get(query['user_id'])
+        return deepcopy(document) if document else None
+
+    def update_one(self, query, update):
+        document = self.documents.get(query['user_id'])
+        if document is None:
+            return FakeResult(0)
+        document.update(deepcopy(update.get('$set', {})))
+        for field, amount in update.get('$inc', {}).items():
+            document[field] = document.get(field, 0) + amount
+        return FakeResult(1)
+
+
+class FakeConnection:
+    def __init__(self, collection: FakeCollection):
+        self.collection = collection
+
+    def get_collection(self, name):
+        return self.collection
+
+
+@pytest.fixture
+def collection():
+    return FakeCollection()
+
+
+def _user_db(collection, db_path):
+    return UserDB(FakeConnection(collection), invalidator=CacheInvalidator(UserCache(), db_path))
+
+
+def test_get_user_reads_through_on_miss(collection, migrated_db):
+    collection.insert_one({'user_id': '1', 'username': 'alice', 'tier': 'free'})
+    users = _user_db(collection, migrated_db)
+
+    assert users.get_user('1')['username'] == 'alice'
+    assert users.get_user('1')['username'] == 'alice'
+    assert users.get_user('missing') is None
+
+    assert collection.reads == 2
+    stats = users.get_cache_stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 2
+
+
+@pytest.mark.parametrize('update, expected', [
+    (lambda users: users.update_tier('1', 'PREMIUM'), {'tier': 'PREMIUM'}),
+    (lambda users: users.update_mt5_id('1', '5550001'), {'mt5_id': '5550001'}),
+    (lambda users: users.update_settings('1', {'risk': 2}), {'settings': {'risk': 2}}),
+    (lambda users: users.downgrade_to_free('1'), {'tier': 'free', 'subscription_end': None}),
+])
+def test_updates_write_through_to_cache(collection, migrated_db, update, expected):
+    users = _user_db(collection, migrated_db)
+    users.create_user('1', 'alice', tier='SUPER', subscription_end='2099-01-01T00:00:00')
+    users.get_user('1')
+    reads = collection.reads
+
+    assert update(users) is True
+
+    user = users.get_user('1')
+    assert collection.reads == reads
+    for field, value in expected.items():
+        assert user[field] == value
+        assert collection.documents['1'][field] == value
+
+
+def test_writes_are_published_to_other_workers(collection, migrated_db):
+    bot = _user_db(collection, migrated_db)
+    websocket = _user_db(collection, migrated_db)
+    bot.create_user('1', 'alice')
+    assert websocket.get_user('1')['tier'] == 'free'
+
+    bot.update_tier('1', 'SUPREME')
+
+    assert websocket.get_user('1')['tier'] == 'SUPREME'
+
+
+def test_concurrent_increments_return_stored_count(collection, migrated_db):
+    bot = _user_db(collection, migrated_db)
+    notifier = _user_db(collection, migrated_db)
+    bot.create_user('1', 'alice')
+    bot.increment_daily_signals('1')
+    bot.get_user('1')
+    notifier.get_user('1')
+
+    bot.increment_daily_signals('1')
+    notifier.increment_daily_signals('1')
+
+    assert collection.documents['1']['daily_signals_count'] == 3
+    assert bot.get_user('1')['daily_signals_count'] == 3
+    assert notifier.get_user('1')['daily_signals_count'] == 3
+
+
+def test_cache_is_bypassed_until_database_is_migrated(collection, tmp_path):
+    collection.insert_one({'user_id': '1', 'username': 'alice', 'tier': 'free'})
+    users = _user_db(collection, str(tmp_path / "missing" / "aurea.db"))
+
+    assert users.get_user('1')['username'] == 'alice'
+    assert users.update_tier('1', 'PREMIUM') is True
+    assert users.get_user('1')['tier'] == 'PREMIUM'
+    assert users.get_cache_stats()['entries'] == 0
+    assert not (tmp_path / "missing").exists()
+
+
+def test_increment_drops_cached_count(collection, migrated_db):
+    users = _user_db(collection, migrated_db)
+    users.create_user('1', 'alice')
+    users.increment_daily_signals('1')
+    users.get_user('1')
+
+    # Increments by another worker that this cache has not seen yet
+    collection.documents['1']['daily_signals_count'] = 5
+    users.increment_daily_signals('1')
+
+    assert users.get_user('1')['daily_signals_count'] == 6